@@ -2,12 +2,16 @@
 from modules.gStateHandler import *
 from pygame import init, display, time, QUIT, MOUSEBUTTONDOWN, event
 from pygame import quit as pg_quit
+from modules.telemetry import events
+import os
 
 
 init()
 display.set_caption("Legally Not Set!")
 win = display.set_mode((915, 575))
 clock = time.Clock()
+if os.environ.get("LNS_TELEMETRY"):
+    events.start(os.environ["LNS_TELEMETRY"])
 newGame = GameState()
 
 
@@ -23,6 +27,8 @@ while run:
 
         if ent.type == QUIT:
             run = False
+            newGame.game.speculator.stop()
+            events.stop()
             pg_quit()
             sys.exit()
             quit()
@@ -31,6 +37,8 @@ while run:
     display.update()
 
 
+newGame.game.speculator.stop()
+events.stop()
 pg_quit()
 sys.exit()
 quit()
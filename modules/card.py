@@ -3,6 +3,7 @@
 from pygame import mouse
 
 from .shapes import assignCardRender, cardOutline
+from .telemetry import events
 
 
 class Card:
@@ -82,10 +83,13 @@ class Card:
             if self.id not in cards:
                 #self.isSelected = True
                 cards.append(self.id)
+                if events.enabled:
+                    events.record("select", self.id)
 
             else:
                 cards.remove(self.id)
+                if events.enabled:
+                    events.record("deselect", self.id)
             # self.isSelected = False
-            print(cards)
 
 
@@ -3,6 +3,7 @@ from .shapes import text_object
 from .game import Game
 from .button import Button
 from .card import Card
+from .telemetry import events
 from pygame import transform, font
 from pygame import quit as pg_quit
 import sys
@@ -84,6 +85,8 @@ class GameState:
         GameState.state = 3
 
     def quit(self):
+        self.game.speculator.stop()
+        events.stop()
         pg_quit()
         sys.exit()
         quit()
@@ -2,9 +2,12 @@
 
 import random
 from itertools import combinations
+from time import perf_counter
 from .card import Card
 from .shapes import sideMenu
 from .button import Button
+from .telemetry import events
+from .speculate import Speculator, Transition
 
 
 
@@ -37,6 +40,8 @@ class Game:
             solutionIds: A Dictionary with ID combination Keys and their Solution value
             selectedCards: A List that holds the Cards the User has selected
             score: The integer count of the claimed Sets
+            boardTime: The perf_counter time the current board was dealt, used for time-to-find
+            speculator: A Speculator that precomputes the board after each possible claim
             buttons: A List of Buttons used to navigate the Application
 
     """
@@ -45,6 +50,8 @@ class Game:
         self.cardPos = [(10, 15), (175, 15), (340, 15), (505, 15),
                (10, 200), (175, 200), (340, 200), (505, 200),
                (10, 385), (175, 385), (340, 385), (505, 385)]
+        self.menuPos = (665, 0)
+        self.buttonPos = [(690, 300), (690, 380), (690, 460)]
         newDeck = []
         for a in range(1, 4):
             for b in range(1, 4):
@@ -59,6 +66,8 @@ class Game:
         self.solutionIds = {}
         self.selectedCards = []
         self.score = 0
+        self.boardTime = 0.0
+        self.speculator = Speculator(self)
         self.buttons = [Button("Shuffle", self.shuffleCards), Button("Reset Game", self.resetGame),
                         Button("Back to Title", self.rTT)]
 
@@ -78,10 +87,12 @@ class Game:
         for combos in idComboStart:
             self.solutionIds[frozenset(combos)] = self.getSolutionId(combos[0], combos[1])
 
-        if self.checkBoard():
-            print("yay!")
+        if self.checkBoard(self.idListInPlay, self.solutionIds):
+            self.boardTime = perf_counter()
+            if events.enabled:
+                events.record("start", self.idListInPlay[:])
+            self.speculator.schedule()
         else:
-            print("uh oh!")
             self.resetGame()
 
 
@@ -119,12 +130,11 @@ class Game:
         display.fill((0, 0, 0))
 
 
-        display.blit(sideMenu(self.score, len(self.newDeck)), (665, 0))
+        display.blit(sideMenu(self.score, len(self.newDeck)), self.menuPos)
 
 
-        self.buttons[0].drawButton(display, (690, 300))
-        self.buttons[1].drawButton(display, (690, 380))
-        self.buttons[2].drawButton(display, (690, 460))
+        for button, pos in zip(self.buttons, self.buttonPos):
+            button.drawButton(display, pos)
 
 
         for card in self.cardsInPlay:
@@ -153,6 +163,9 @@ class Game:
         Meant to help Users find Triads by looking at a different perspective
         """
         random.shuffle(self.cardsInPlay)
+        if events.enabled:
+            events.record("shuffle")
+        self.speculator.schedule()
 
     def checkSet(self):
         """
@@ -167,41 +180,96 @@ class Game:
         c3 = self.selectedCards[2]
         if self.solutionIds[c12] == c3:
             self.score += 1
-            print("yes!")
+            if events.enabled:
+                now = perf_counter()
+                events.record("claim", self.selectedCards[:], self.score)
+                events.record("find", round(now - self.boardTime, 6))
+            self.boardTime = perf_counter()
             self.newCards()
         else:
-            print("no!")
+            if events.enabled:
+                events.record("miss", self.selectedCards[:])
         self.selectedCards.clear()
 
     def newCards(self):
         """
-        Removes the Selected Cards in play and any references to them in other Lists.
+        Replaces the Selected Cards in play.
+        If the Speculator has already worked out the Transition for this Triad, it is committed as is.
+        Otherwise, the Transition is computed here.
+        """
+        triad = frozenset(self.selectedCards)
+        transition = self.speculator.take(triad)
+        if events.enabled:
+            events.record("speculation", transition is not None, round(self.speculator.hitRate(), 4))
+        if transition is None:
+            transition = self.claimTransition(triad, self.cardsInPlay, self.idListInPlay, self.solutionIds,
+                                              self.newDeck)
+        self.commitTransition(transition)
+
+    def claimTransition(self, triad, cardsInPlay, idListInPlay, solutionIds, newDeck):
+        """
+        Works out the board after a Triad is claimed, without changing the Game or any of the arguments.
+        Removes the claimed Cards and any references to them.
         Then, checks if there are any Combos with the remaining Cards in play
         Then, replaces the removed cards appropriately.
 
-        Returns: Nothing (in the event no Cards are left)
+        Args:
+            triad: A frozenset of the 3 claimed IDs
+            cardsInPlay: The Cards in play
+            idListInPlay: Their IDs
+            solutionIds: A Dictionary with ID combination Keys and their Solution value
+            newDeck: The deck
+
+        Returns: A Transition
 
         """
-        for i in self.selectedCards:
-            self.claimedCards.append(self.cardsInPlay[self.cardsInPlay.index(i)])
-        self.solutionIds = {k:v for (k,v) in self.solutionIds.items() if len(k & set(self.selectedCards)) == 0}
-        self.idListInPlay = [id for id in self.idListInPlay if id not in self.selectedCards]
-        self.cardsInPlay = [card for card in self.cardsInPlay if card.getID() not in self.selectedCards]
+        claimed = [card for card in cardsInPlay if card.id in triad]
+        solutionIds = {k:v for (k,v) in solutionIds.items() if len(k & triad) == 0}
+        idListInPlay = [id for id in idListInPlay if id not in triad]
+        cardsInPlay = [card for card in cardsInPlay if card.id not in triad]
+        newDeck = list(newDeck)
         tempCardList = []
-        if not self.checkBoard() and (not self.anySolCardLeft()):
+        guaranteed = False
+        boardHasTriad = self.checkBoard(idListInPlay, solutionIds)
+        if not boardHasTriad and not self.anySolCardLeft(newDeck, solutionIds):
+            return Transition(claimed, cardsInPlay, idListInPlay, solutionIds, newDeck, tempCardList, False, True)
+        elif boardHasTriad and len(newDeck) > 0:
+            tempCardList = self.anyCard(newDeck)
+        elif not boardHasTriad:
+            tempCardList = self.guarenteedCard(newDeck, solutionIds)
+            guaranteed = True
+        for card in tempCardList:
+            cardsInPlay.append(card)
+            for i in idListInPlay:
+                solutionIds[frozenset([i, card.id])] = self.getSolutionId(i, card.id)
+            idListInPlay.append(card.id)
+        return Transition(claimed, cardsInPlay, idListInPlay, solutionIds, newDeck, tempCardList, guaranteed, False)
+
+    def commitTransition(self, transition):
+        """
+        Makes a Transition the Game's board, then asks the Speculator to precompute the next one.
+        A guaranteed draw is shuffled here, on the main thread, so the Speculator never touches
+        the global random generator and seeded games stay reproducible.
+
+        Args:
+            transition: The Transition returned by claimTransition
+        """
+        if transition.guaranteed:
+            count = len(transition.drawn)
+            random.shuffle(transition.drawn)
+            transition.cardsInPlay[-count:] = transition.drawn
+            transition.idListInPlay[-count:] = [card.id for card in transition.drawn]
+        self.claimedCards.extend(transition.claimed)
+        self.cardsInPlay = transition.cardsInPlay
+        self.idListInPlay = transition.idListInPlay
+        self.solutionIds = transition.solutionIds
+        self.newDeck = transition.newDeck
+        if transition.gameOver:
             self.gameOver()
             return
-        elif self.checkBoard() and len(self.newDeck) > 0:
-            print("you good")
-            tempCardList = self.anyCard()
-        elif not self.checkBoard() and self.anySolCardLeft():
-            print("i got u fam")
-            tempCardList = self.guarenteedCard()
-        for card in tempCardList:
-            self.cardsInPlay.append(card)
-            for i in self.idListInPlay:
-                self.solutionIds[frozenset([i, card.id])] = self.getSolutionId(i,card.id)
-            self.idListInPlay.append(card.id)
+        if transition.guaranteed and events.enabled:
+            events.record("guaranteed", [card.id for card in transition.drawn])
+        self.speculator.schedule()
 
     def resetGame(self):
         """
@@ -214,6 +282,7 @@ class Game:
         Then, Shuffles the Deck
         Finally, Starts Game
         """
+        self.speculator.invalidate()
         self.score = 0
         self.selectedCards.clear()
         self.newDeck.extend(self.claimedCards)
@@ -227,45 +296,59 @@ class Game:
 
 
 
-    def checkBoard(self):
+    @staticmethod
+    def checkBoard(idListInPlay, solutionIds):
         """
         Checks if any IDs of the Cards in play are also a Solution ID
 
+        Args:
+            idListInPlay: The IDs of the Cards in play
+            solutionIds: A Dictionary with ID combination Keys and their Solution value
+
         Returns: Boolean
 
         """
-        return any(id in self.idListInPlay for id in list(self.solutionIds.values()))
+        inPlay = set(idListInPlay)
+        return any(id in inPlay for id in solutionIds.values())
 
-    def guarenteedCard(self):
+    @staticmethod
+    def guarenteedCard(newDeck, solutionIds):
         """
         Finds the first Card in the Deck with a Solution ID,
         Then puts it in a List with the next 2 Cards in the Deck
-        Then shuffles those 3 Cards
+        (the 3 Cards are shuffled when the Transition is committed)
 
+        Args:
+            newDeck: The deck the Cards are popped from
+            solutionIds: A Dictionary with ID combination Keys and their Solution value
 
         Returns: A List of 3 Cards
 
         """
+        solutions = set(solutionIds.values())
         tempCardList = []
-        for i in range(len(self.newDeck)):
-            if self.newDeck[i].id in self.solutionIds.values():
-                tempCardList.append(self.newDeck.pop(i))
+        for i in range(len(newDeck)):
+            if newDeck[i].id in solutions:
+                tempCardList.append(newDeck.pop(i))
                 break
-        tempCardList.append(self.newDeck.pop())
-        tempCardList.append(self.newDeck.pop())
-        random.shuffle(tempCardList)
+        tempCardList.append(newDeck.pop())
+        tempCardList.append(newDeck.pop())
         return tempCardList
 
-    def anyCard(self):
+    @staticmethod
+    def anyCard(newDeck):
         """
         Pops the first 3 Cards off of the Deck
 
+        Args:
+            newDeck: The deck the Cards are popped from
+
         Returns: A List of 3 Cards
 
         """
         tempCardList = []
         for i in range(3):
-            tempCardList.append(self.newDeck.pop())
+            tempCardList.append(newDeck.pop())
         return tempCardList
 
 
@@ -284,7 +367,11 @@ class Game:
         Used when there are no possible Triads left for the Player to make
         """
         from .gStateHandler import GameState
+        if events.enabled:
+            events.record("gameover")
         GameState.state = 2
 
-    def anySolCardLeft(self):
-        return any(ids in self.newDeck for ids in self.solutionIds.values())
+    @staticmethod
+    def anySolCardLeft(newDeck, solutionIds):
+        deckIds = set(card.id for card in newDeck)
+        return any(ids in deckIds for ids in solutionIds.values())
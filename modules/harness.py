@@ -0,0 +1,201 @@
+"""This Module renders every GameState offscreen and checks the frames against stored goldens.
+
+It runs under the SDL dummy video driver, so no window or display is needed. Each GameState is
+rendered into an offscreen Surface the size of the game window. All 81 Card faces are also tiled
+into one "deck" frame, so every face assignCardRender can draw is covered, not only the ones dealt.
+Each frame is hashed and compared pixel by pixel with a golden PNG, then rendered many more times
+to time it.
+
+The game is seeded so the deck (and so the Game frame) is the same on every run.
+
+Usage:
+    python -m modules.harness            compare against the goldens and time each state
+    python -m modules.harness --update   write new goldens from the current rendering code
+
+This script requires that `pygame` and `numpy` are installed.
+
+"""
+import argparse
+import hashlib
+import os
+import random
+import sys
+from time import perf_counter
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from pygame import Surface, display, image, init, surfarray
+from pygame import quit as pg_quit
+
+from .gStateHandler import GameState
+from .shapes import assignCardRender
+
+
+# The size of the game window
+windowSize = (915, 575)
+
+# Names of the GameStates, in the order of GameState.stateListRender
+stateNames = ["title", "game", "gameover", "rules"]
+
+# The deck frame tiles the 81 Card faces in a 9x9 grid
+deckColumns = 9
+deckSize = (150 * deckColumns, 175 * 81 // deckColumns)
+
+goldenDir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "goldens")
+
+
+def seededGameState(seed=0):
+    """
+    Creates a GameState with a started Game and one selected Card, so the selection outline is drawn too
+
+    Args:
+        seed: The seed used for every shuffle
+
+    Returns: A GameState
+    """
+    random.seed(seed)
+    gameState = GameState()
+    gameState.game.resetGame()
+    gameState.game.selectedCards.append(gameState.game.idListInPlay[0])
+    return gameState
+
+
+def renderState(gameState, state, surface):
+    """
+    Renders one GameState into an offscreen Surface
+
+    Args:
+        gameState: The GameState being rendered
+        state: The index of the GameState to render
+        surface: The offscreen Surface
+    """
+    previous = GameState.state
+    GameState.state = state
+    try:
+        gameState.gameStateRender(surface)
+    finally:
+        GameState.state = previous
+
+
+def renderDeck(surface):
+    """
+    Draws all 81 Card faces with assignCardRender, tiled in ID order
+
+    Args:
+        surface: The offscreen Surface, of size deckSize
+    """
+    index = 0
+    for number in range(1, 4):
+        for shape in range(1, 4):
+            for color in range(1, 4):
+                for fill_type in range(1, 4):
+                    pos = (150 * (index % deckColumns), 175 * (index // deckColumns))
+                    surface.blit(assignCardRender(number, shape, color, fill_type), pos)
+                    index += 1
+
+
+def frameHash(surface):
+    """
+    Returns: The SHA-256 hex digest of the Surface's RGB pixels
+    """
+    return hashlib.sha256(image.tobytes(surface, "RGB")).hexdigest()
+
+
+def diffPixels(surface, golden):
+    """
+    Counts the pixels that differ between two Surfaces of the same size
+
+    Args:
+        surface: The Surface that was just rendered
+        golden: The golden Surface it is compared against
+
+    Returns: The integer count of differing pixels, or -1 if the sizes don't match
+    """
+    if surface.get_size() != golden.get_size():
+        return -1
+    return int((surfarray.array3d(surface) != surfarray.array3d(golden)).any(axis=2).sum())
+
+
+def timeFrame(render, frames):
+    """
+    Args:
+        render: A function that draws one frame
+        frames: The number of frames to draw
+
+    Returns: The mean number of seconds it takes to draw one frame
+    """
+    start = perf_counter()
+    for _ in range(frames):
+        render()
+    return (perf_counter() - start) / frames
+
+
+def runHarness(update=False, frames=1000, directory=goldenDir):
+    """
+    Renders each GameState and the deck, compares them with their goldens and times them
+
+    Args:
+        update: Whether to write new goldens instead of comparing
+        frames: The number of frames rendered per state for timing (0 skips timing)
+        directory: Where the golden PNGs are stored
+
+    Returns: A List of the names of the states that don't match their goldens
+    """
+    init()
+    display.set_mode(windowSize)
+    gameState = seededGameState()
+    windowSurface = Surface(windowSize)
+    deckSurface = Surface(deckSize)
+    failures = []
+    os.makedirs(directory, exist_ok=True)
+
+    # Each target is a name, the Surface it is drawn on and a function that draws one frame
+    targets = [(name, windowSurface, lambda state=state: renderState(gameState, state, windowSurface))
+               for state, name in enumerate(stateNames)]
+    targets.append(("deck", deckSurface, lambda: renderDeck(deckSurface)))
+
+    for name, surface, render in targets:
+        render()
+        goldenPath = os.path.join(directory, name + ".png")
+        actualPath = os.path.join(directory, name + ".actual.png")
+        result = frameHash(surface)[:16]
+
+        if update:
+            image.save(surface, goldenPath)
+            result += "  written"
+        elif not os.path.exists(goldenPath):
+            failures.append(name)
+            result += "  no golden (run with --update)"
+        else:
+            changed = diffPixels(surface, image.load(goldenPath))
+            if changed:
+                failures.append(name)
+                image.save(surface, actualPath)
+                problem = "frame size differs" if changed < 0 else "%d pixels differ" % changed
+                result += "  FAIL: %s, frame saved to %s" % (problem, actualPath)
+            else:
+                result += "  ok"
+                if os.path.exists(actualPath):
+                    os.remove(actualPath)
+
+        if frames:
+            result += "  %.3f ms/frame" % (timeFrame(render, frames) * 1000)
+        print("%-9s %s" % (name, result))
+
+    gameState.game.speculator.stop()
+    pg_quit()
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render every GameState offscreen and diff against goldens.")
+    parser.add_argument("--update", action="store_true", help="write new goldens instead of comparing")
+    parser.add_argument("--frames", type=int, default=1000, help="frames rendered per state for timing")
+    parser.add_argument("--goldens", default=goldenDir, help="directory holding the golden PNGs")
+    args = parser.parse_args(argv)
+    failures = runHarness(args.update, args.frames, args.goldens)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
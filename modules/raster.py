@@ -0,0 +1,215 @@
+"""This Module rasterizes Card faces with NumPy at any resolution.
+
+shapes.assignCardRender draws a Card at its native 150x175 size with pygame.draw calls. This
+module produces the same faces at any scale (2x and 3x for high-DPI screens, or larger) by
+building the shapes as NumPy arrays instead:
+
+Each shape is a boolean mask computed from its geometry, sampled at the center of every pixel.
+The Outline fill-type is the shape's mask minus the same shape inset by one native pixel, and the
+Striped fill-type is the solid mask with the white stripe columns of drawStripes cut out. Every
+(shape, color, fill-type) is colored once into an RGB tile, and each Card is assembled by copying
+its tiles into a white card array, which is written into a Surface through surfarray.
+
+The layout (numberCoord) and colors are the same as in the shapes module, measured in native
+pixels and multiplied by the scale.
+
+Usage:
+    python -m modules.raster
+
+times rasterizeDeck at 2x, 3x and 4x and reports how many pixels of each 1x face differ from
+assignCardRender.
+
+This script requires that `pygame` and `numpy` are installed.
+
+"""
+import argparse
+import sys
+from functools import lru_cache
+from time import perf_counter
+
+import numpy as np
+from pygame import Surface, surfarray
+
+from .shapes import assignCardRender, colors, numberCoord
+
+
+# The native size of a Card and of the box a shape is drawn in
+nativeCard = (150, 175)
+nativeShape = (110, 40)
+
+# The native columns drawStripes paints white
+stripeColumns = range(10, 140, 3)
+
+
+def cardSize(scale):
+    """
+    Args:
+        scale: The factor the native Card size is multiplied by
+
+    Returns: The width and height of a Card at that scale
+    """
+    return round(nativeCard[0] * scale), round(nativeCard[1] * scale)
+
+
+def shapeMask(shape, scale, inset=0.0):
+    """
+    Builds the boolean mask of one shape.
+
+    Args:
+        shape: The type of Shape (1 Rectangle, 2 Oval, 3 Diamond)
+        scale: The factor the native shape size is multiplied by
+        inset: How many native pixels the shape is shrunk by on every side
+
+    Returns: A (width, height) boolean array, indexed like surfarray
+    """
+    # draw.polygon includes the pixels its corners land on, so the Diamond is one native pixel
+    # wider and taller than the other shapes
+    extent = 1 if shape == 3 else 0
+    width, height = round((nativeShape[0] + extent) * scale), round((nativeShape[1] + extent) * scale)
+    halfW, halfH = (nativeShape[0] + extent) / 2, (nativeShape[1] + extent) / 2
+    dx = np.abs((np.arange(width) + 0.5) / scale - halfW)[:, None]
+    dy = np.abs((np.arange(height) + 0.5) / scale - halfH)[None, :]
+
+    if shape == 1:
+        return (dx < halfW - inset) & (dy < halfH - inset)
+    if shape == 2:
+        return (dx / (halfW - inset)) ** 2 + (dy / (halfH - inset)) ** 2 <= 1
+    # The edges of the Diamond are lines, so insetting them moves each edge in along its normal
+    return dx / halfW + dy / halfH <= 1 - inset * np.hypot(1 / halfW, 1 / halfH)
+
+
+def stripeMask(scale):
+    """
+    Args:
+        scale: The factor the native Card size is multiplied by
+
+    Returns: A boolean array over the Card's columns that is True where drawStripes paints white
+    """
+    columns = np.zeros(cardSize(scale)[0], dtype=bool)
+    for native in stripeColumns:
+        columns[round(native * scale):max(round((native + 1) * scale), round(native * scale) + 1)] = True
+    return columns
+
+
+@lru_cache(maxsize=8)
+def shapeTiles(scale):
+    """
+    Colors every (shape, color, fill-type) once into an RGB tile on a white background.
+    Tiles are cached per scale, as every Card at that scale is built from them.
+
+    Args:
+        scale: The factor the native size is multiplied by
+
+    Returns: A Dictionary of (shape, color, fill_type) keys and their (width, height, 3) uint8 tiles
+    """
+    stripes = stripeMask(scale)
+    left = round(numberCoord[1][0][0] * scale)
+    tiles = {}
+    for shape in range(1, 4):
+        solid = shapeMask(shape, scale)
+        fills = {1: solid,
+                 2: solid & ~shapeMask(shape, scale, inset=1.0),
+                 3: solid & ~stripes[left:left + solid.shape[0], None]}
+        for fill_type, mask in fills.items():
+            for color, rgb in colors.items():
+                tile = np.full(mask.shape + (3,), 255, dtype=np.uint8)
+                tile[mask] = rgb
+                tiles[(shape, color, fill_type)] = tile
+    return tiles
+
+
+def rasterizeArray(number, shape, color, fill_type, scale):
+    """
+    Builds a Card face as an array.
+
+    Args:
+        number: The number of Shapes.
+        shape: The type of Shapes.
+        color: The color of the Shapes.
+        fill_type: The fill-type of the Shapes.
+        scale: The factor the native size is multiplied by
+
+    Returns: A (width, height, 3) uint8 array, indexed like surfarray
+    """
+    tile = shapeTiles(scale)[(shape, color, fill_type)]
+    face = np.full(cardSize(scale) + (3,), 255, dtype=np.uint8)
+    for x, y in numberCoord[number]:
+        left, top = round(x * scale), round(y * scale)
+        face[left:left + tile.shape[0], top:top + tile.shape[1]] = tile
+    return face
+
+
+def rasterizeCard(number, shape, color, fill_type, scale=1):
+    """
+    Creates the visual representation of a Card at any scale, like assignCardRender.
+
+    Returns: A Surface of size cardSize(scale) with the shapes drawn onto it.
+    """
+    face = Surface(cardSize(scale))
+    surfarray.blit_array(face, rasterizeArray(number, shape, color, fill_type, scale))
+    return face
+
+
+def rasterizeDeck(scale=1):
+    """
+    Creates the visual representation of all 81 Cards at one scale.
+
+    Args:
+        scale: The factor the native size is multiplied by
+
+    Returns: A Dictionary of Card ID keys and their Surfaces
+    """
+    faces = {}
+    for number in range(1, 4):
+        for shape in range(1, 4):
+            for color in range(1, 4):
+                for fill_type in range(1, 4):
+                    faces[number * 1000 + shape * 100 + color * 10 + fill_type] = \
+                        rasterizeCard(number, shape, color, fill_type, scale)
+    return faces
+
+
+def faceDifferences():
+    """
+    Compares every 1x face with the one assignCardRender draws.
+
+    Returns: A Dictionary of Card ID keys and the integer count of pixels that differ
+    """
+    differences = {}
+    for cardId, face in rasterizeDeck(1).items():
+        number, shape, color, fill_type = (int(digit) for digit in str(cardId))
+        native = assignCardRender(number, shape, color, fill_type)
+        differences[cardId] = int((surfarray.array3d(face) != surfarray.array3d(native)).any(axis=2).sum())
+    return differences
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time rasterizeDeck and compare its faces with assignCardRender.")
+    parser.add_argument("--scales", type=float, nargs="+", default=[2, 3, 4], help="scales to time")
+    args = parser.parse_args(argv)
+
+    for scale in args.scales:
+        shapeTiles.cache_clear()
+        start = perf_counter()
+        rasterizeDeck(scale)
+        print("%gx  %dx%d  81 faces in %.3fs" % ((scale,) + cardSize(scale) + (perf_counter() - start,)))
+
+    differences = faceDifferences()
+    print("1x pixels differing from assignCardRender (of %d per face):" % (nativeCard[0] * nativeCard[1]))
+    names = {1: "rectangle", 2: "oval", 3: "diamond"}
+    fills = {1: "solid", 2: "outline", 3: "striped"}
+    for shape in range(1, 4):
+        for fill_type in range(1, 4):
+            group = {cardId: count for cardId, count in differences.items()
+                     if cardId // 100 % 10 == shape and cardId % 10 == fill_type}
+            worst = max(group, key=group.get)
+            print("  %-9s %-7s  mean %5.1f  worst %3d (%d)" % (names[shape], fills[fill_type],
+                                                               sum(group.values()) / len(group), group[worst], worst))
+    worst = max(differences, key=differences.get)
+    print("  all faces          mean %5.1f  worst %3d (%d)" % (sum(differences.values()) / len(differences),
+                                                               differences[worst], worst))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -97,20 +97,31 @@ def text_object(text, font):
 
 
 
-def sideMenu(score, remaining):
+def sideMenuBase():
+    # Draws the parts of the Side Menu that never change (background and labels)
     sideBar = Surface((250, 575))
     sideBar.fill((220, 220, 220))
     largeText = font.Font('freesansbold.ttf', 25)
-    numberText = font.Font('freesansbold.ttf', 50)
 
 
     draw.rect(sideBar, (255, 255, 255), ((25, 460), (200, 65)))
 
 
     sideBar.blit(text_object("Score", largeText), (5, 15))
-    sideBar.blit(text_object(str(score), numberText), (5, 55))
-
     sideBar.blit(text_object("Cards Remaining", largeText), (5, 130))
-    sideBar.blit(text_object(str(remaining), numberText), (5, 170))
+    return sideBar
+
+
+# Positions of the Score and Cards Remaining numbers on the Side Menu
+scorePos = (5, 55)
+remainingPos = (5, 170)
+
+
+def sideMenu(score, remaining):
+    sideBar = sideMenuBase()
+    numberText = font.Font('freesansbold.ttf', 50)
+
+    sideBar.blit(text_object(str(score), numberText), scorePos)
+    sideBar.blit(text_object(str(remaining), numberText), remainingPos)
     return sideBar
 
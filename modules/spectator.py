@@ -0,0 +1,259 @@
+"""This Module contains the Spectator, an operator screen that shows many live Games at once.
+
+Each Game is drawn as a miniature of the Game.renderGame layout. Everything that never changes
+(the black board, the Side Menu labels and the Buttons) is drawn once at full size and scaled into
+a single board sprite. Every Card face is scaled once into a sprite keyed by its ID, and the
+Score and Cards Remaining numbers are cut from a cached strip of digit glyphs. A frame is then a
+single Surface.blits call, with no Surfaces created and no text rendered per board.
+
+Usage:
+    python -m modules.spectator --boards 32 --size 1600x900
+
+opens an operator window of self-playing Games, with the frame rate shown in the caption.
+With --seconds it closes on its own and prints the claim rate and frame rate it reached.
+
+This script requires that `pygame` is installed.
+
+"""
+import argparse
+import random
+import sys
+from math import ceil
+
+from pygame import QUIT, Surface, display as pg_display, event, font, init, time, transform
+from pygame import quit as pg_quit
+
+from .game import Game
+from .shapes import cardOutline, sideMenuBase, scorePos, remainingPos
+from .speculate import boardTriads
+
+
+# The size of the window a single Game is rendered in
+boardSize = (915, 575)
+
+
+def gridLayout(count, size):
+    """
+    Finds the number of columns that lets count boards be drawn as large as possible inside size.
+
+    Args:
+        count: The number of boards
+        size: The width and height of the area the boards are drawn in
+
+    Returns: A tuple of (columns, rows, scale)
+    """
+    best = (1, count, 0.0)
+    for columns in range(1, count + 1):
+        rows = ceil(count / columns)
+        scale = min(size[0] / columns / boardSize[0], size[1] / rows / boardSize[1])
+        if scale > best[2]:
+            best = (columns, rows, scale)
+    return best
+
+
+class Spectator:
+    """
+    The Spectator composites many Games onto one display in a single batched blit.
+
+        Attributes:
+            games: The List of Games being watched
+            scale: The factor every board is scaled by
+            origins: A List of the top-left position of each board
+            boardSprite: A Surface of the parts of a board that never change
+            cardSprites: A Dictionary of Card ID keys and their scaled Surfaces
+            outlineSprite: A scaled Surface used to show selected Cards
+            cardPos: A List of the scaled positions of the Cards in play
+            digitStrip: A Surface holding the glyphs 0-9 side by side
+            digitAreas: A List of the Rect areas of each digit in digitStrip
+    """
+
+    def __init__(self, games, size, margin=4):
+        """
+        Initiates the Spectator and builds every sprite it needs
+
+        Args:
+            games: The List of Games being watched (all must share the same layout)
+            size: The width and height of the area the boards are drawn in
+            margin: The number of pixels left between boards
+        """
+        if not games:
+            raise ValueError("Spectator needs at least one Game to watch")
+        self.games = games
+        columns, rows, scale = gridLayout(len(games), size)
+        cellW = size[0] // columns
+        cellH = size[1] // rows
+        self.scale = min((cellW - margin) / boardSize[0], (cellH - margin) / boardSize[1])
+        self.origins = [((i % columns) * cellW, (i // columns) * cellH) for i in range(len(games))]
+
+        template = games[0]
+        self.cardPos = [self.scaled(pos) for pos in template.cardPos]
+        self.scorePos = self.scaled((template.menuPos[0] + scorePos[0], template.menuPos[1] + scorePos[1]))
+        self.remainingPos = self.scaled((template.menuPos[0] + remainingPos[0],
+                                         template.menuPos[1] + remainingPos[1]))
+
+        board = Surface(boardSize)
+        board.fill((0, 0, 0))
+        board.blit(sideMenuBase(), template.menuPos)
+        for button, pos in zip(template.buttons, template.buttonPos):
+            board.blit(button.render, pos)
+        self.boardSprite = self.prepare(transform.smoothscale(board, self.scaled(boardSize)))
+
+        cardSize = self.scaled((150, 175))
+        self.cardSprites = {}
+        for card in template.newDeck + template.cardsInPlay + template.claimedCards:
+            self.cardSprites[card.id] = self.prepare(transform.smoothscale(card.render, cardSize))
+        self.outlineSprite = self.prepare(transform.smoothscale(cardOutline(), cardSize), alpha=True)
+
+        self.buildDigits()
+
+    def scaled(self, xy):
+        """
+        Args:
+            xy: A full-size position or size
+
+        Returns: The position or size scaled to a miniature board
+        """
+        return round(xy[0] * self.scale), round(xy[1] * self.scale)
+
+    @staticmethod
+    def prepare(sprite, alpha=False):
+        """
+        Converts a sprite to the display's pixel format (when there is a display) so blits are fast
+
+        Args:
+            sprite: The Surface to convert
+            alpha: Whether the Surface has per-pixel transparency
+
+        Returns: The converted Surface
+        """
+        if pg_display.get_surface() is None:
+            return sprite
+        return sprite.convert_alpha() if alpha else sprite.convert()
+
+    def buildDigits(self):
+        """
+        Renders the glyphs 0-9 once, at the scaled size, onto the Side Menu background color,
+        and records the area of each glyph so numbers can be blitted straight from the strip.
+        """
+        numberText = font.Font('freesansbold.ttf', max(1, round(50 * self.scale)))
+        glyphs = [numberText.render(str(digit), True, (0, 0, 0), (220, 220, 220)) for digit in range(10)]
+        strip = Surface((sum(glyph.get_width() for glyph in glyphs), max(glyph.get_height() for glyph in glyphs)))
+        strip.fill((220, 220, 220))
+        self.digitAreas = []
+        x = 0
+        for glyph in glyphs:
+            strip.blit(glyph, (x, 0))
+            self.digitAreas.append(glyph.get_rect(topleft=(x, 0)))
+            x += glyph.get_width()
+        self.digitStrip = self.prepare(strip)
+
+    def numberBlits(self, blits, value, pos):
+        """
+        Adds the blits for an integer drawn from the digit strip
+
+        Args:
+            blits: The List of blits being built for this frame
+            value: The non-negative integer to draw
+            pos: The top-left position of the number
+        """
+        x, y = pos
+        for digit in str(value):
+            area = self.digitAreas[ord(digit) - 48]
+            blits.append((self.digitStrip, (x, y), area))
+            x += area.width
+
+    def renderSpectator(self, display):
+        """
+        Draws every watched Game in one Surface.blits batch
+
+        Args:
+            display: Where the boards are rendered (expected to be pygame.display)
+        """
+        blits = []
+        boardSprite = self.boardSprite
+        cardSprites = self.cardSprites
+        outlineSprite = self.outlineSprite
+        cardPos = self.cardPos
+        for game, (ox, oy) in zip(self.games, self.origins):
+            blits.append((boardSprite, (ox, oy)))
+            selected = game.selectedCards
+            for card, (x, y) in zip(game.cardsInPlay, cardPos):
+                blits.append((cardSprites[card.id], (ox + x, oy + y)))
+                if card.id in selected:
+                    blits.append((outlineSprite, (ox + x, oy + y)))
+            self.numberBlits(blits, game.score, (ox + self.scorePos[0], oy + self.scorePos[1]))
+            self.numberBlits(blits, len(game.newDeck), (ox + self.remainingPos[0], oy + self.remainingPos[1]))
+        display.blits(blits, False)
+
+
+def autoplay(game):
+    """
+    Claims a random Triad on a Game's board, or resets the Game when none are left
+
+    Args:
+        game: The Game being played
+    """
+    triads = boardTriads(game.idListInPlay, game.solutionIds)
+    if not triads:
+        game.resetGame()
+        return
+    game.selectedCards[:] = random.choice(triads)
+    game.checkSet()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Watch many self-playing Games at once.")
+    parser.add_argument("--boards", type=int, default=32, help="number of Games to watch")
+    parser.add_argument("--size", default="1600x900", help="window size as WIDTHxHEIGHT")
+    parser.add_argument("--claims", type=float, default=20.0, help="claims made per second across all Games")
+    parser.add_argument("--seconds", type=float, default=0, help="close after this many seconds (0 runs until closed)")
+    args = parser.parse_args(argv)
+    if args.boards < 1:
+        parser.error("--boards must be at least 1")
+    size = tuple(int(n) for n in args.size.lower().split("x"))
+
+    init()
+    window = pg_display.set_mode(size)
+    games = [Game() for _ in range(args.boards)]
+    for game in games:
+        game.resetGame()
+    spectator = Spectator(games, size)
+    clock = time.Clock()
+    claimEvery = 1000 / args.claims if args.claims > 0 else 0
+    start = time.get_ticks()
+    nextClaim = start
+    claims = 0
+
+    run = True
+    while run:
+        for ent in event.get():
+            if ent.type == QUIT:
+                run = False
+        now = time.get_ticks()
+        if args.seconds and now - start >= args.seconds * 1000:
+            run = False
+        # The frame rate is capped, so make every claim that came due since the last frame.
+        # If the claims can't keep up, skip the backlog rather than falling further behind.
+        if claimEvery and now - nextClaim > 1000:
+            nextClaim = now
+        while claimEvery and now >= nextClaim:
+            autoplay(random.choice(games))
+            claims += 1
+            nextClaim += claimEvery
+        window.fill((0, 0, 0))
+        spectator.renderSpectator(window)
+        pg_display.update()
+        clock.tick(60)
+        pg_display.set_caption("Legally Not Set! Spectator - %d boards, %.0f FPS" % (len(games), clock.get_fps()))
+
+    elapsed = (time.get_ticks() - start) / 1000
+    print("%d claims in %.1fs (%.0f claims/s), %.0f FPS" % (claims, elapsed, claims / elapsed if elapsed else 0,
+                                                            clock.get_fps()))
+    for game in games:
+        game.speculator.stop()
+    pg_quit()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+"""This Module precomputes what the board becomes after each possible Triad is claimed.
+
+While the Player is looking for a Triad, a background worker takes a snapshot of the board and,
+for every Triad currently on it, works out everything Game.newCards would do if that Triad were
+claimed: which Cards are removed, which Cards are drawn (including a guaranteed draw), the new
+Solution IDs and whether the game is over. When the Player claims a Triad, the Game commits the
+ready Transition instead of doing that work on the input path.
+
+Any change to the board (a claim, a shuffle or a reset) bumps a generation counter, which
+discards every Transition computed for the old board.
+
+Usage:
+    python -m modules.speculate --games 200
+
+plays seeded games and checks that every speculated Transition matches what the inline claim
+path produces.
+
+This script requires that `pygame` is installed.
+
+"""
+import argparse
+import random
+import sys
+import threading
+from time import sleep
+
+
+class Transition:
+    """
+    A Transition is the state of a Game after one Triad is claimed. It owns all of its Lists,
+    so committing it is just handing them to the Game.
+
+        Attributes:
+            claimed: A List of the 3 claimed Cards
+            cardsInPlay: A List of the Cards in play afterwards
+            idListInPlay: A List of their IDs
+            solutionIds: A Dictionary with ID combination Keys and their Solution value
+            newDeck: The deck afterwards
+            drawn: A List of the Cards drawn from the deck
+            guaranteed: A boolean indicating if drawn was a guaranteed draw
+            gameOver: A boolean indicating if no Triads are left
+    """
+
+    def __init__(self, claimed, cardsInPlay, idListInPlay, solutionIds, newDeck, drawn, guaranteed, gameOver):
+        self.claimed = claimed
+        self.cardsInPlay = cardsInPlay
+        self.idListInPlay = idListInPlay
+        self.solutionIds = solutionIds
+        self.newDeck = newDeck
+        self.drawn = drawn
+        self.guaranteed = guaranteed
+        self.gameOver = gameOver
+
+
+def boardTriads(idListInPlay, solutionIds):
+    """
+    Lists every Triad on the board. Each Triad appears under 3 of its pairs, so they are deduplicated.
+
+    Args:
+        idListInPlay: The IDs of the Cards in play
+        solutionIds: A Dictionary with ID combination Keys and their Solution value
+
+    Returns: A List of frozensets of 3 IDs
+    """
+    inPlay = set(idListInPlay)
+    triads = []
+    seen = set()
+    for pair, solution in solutionIds.items():
+        if solution in inPlay:
+            triad = pair | {solution}
+            if triad not in seen:
+                seen.add(triad)
+                triads.append(triad)
+    return triads
+
+
+class Speculator:
+    """
+    The Speculator runs a background worker that fills a cache of Transitions for a Game's board.
+
+        Attributes:
+            game: The Game whose board is precomputed
+            generation: An integer that is bumped every time the board changes
+            ready: A Dictionary with Triad Keys and their Transition
+            hits: The integer count of claims that found a ready Transition
+            misses: The integer count of claims that had to be computed on the input path
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.generation = 0
+        self.ready = {}
+        self.hits = 0
+        self.misses = 0
+        self.job = None
+        self.stopping = False
+        self.condition = threading.Condition()
+        self.worker = None
+
+    def schedule(self):
+        """
+        Snapshots the Game's board and asks the worker to precompute every Triad on it.
+        Must be called from the thread that changes the board.
+        """
+        game = self.game
+        snapshot = (list(game.cardsInPlay), list(game.idListInPlay), dict(game.solutionIds), list(game.newDeck))
+        with self.condition:
+            self.generation += 1
+            self.ready = {}
+            self.job = (self.generation, snapshot)
+            self.condition.notify()
+        if self.worker is None:
+            self.worker = threading.Thread(target=self.workerLoop, name="speculator", daemon=True)
+            self.worker.start()
+
+    def invalidate(self):
+        """
+        Discards every ready Transition and any job the worker hasn't finished
+        """
+        with self.condition:
+            self.generation += 1
+            self.ready = {}
+            self.job = None
+
+    def stop(self):
+        """
+        Stops the worker and waits for it to exit. A later schedule starts a new worker.
+        """
+        if self.worker is None:
+            return
+        with self.condition:
+            self.stopping = True
+            self.generation += 1
+            self.ready = {}
+            self.job = None
+            self.condition.notify()
+        self.worker.join()
+        self.worker = None
+        self.stopping = False
+
+    def take(self, triad):
+        """
+        Takes the ready Transition for a claimed Triad. The board is about to change,
+        so every other Transition is discarded.
+
+        Args:
+            triad: A frozenset of the 3 claimed IDs
+
+        Returns: The Transition, or None if the worker hasn't computed it yet
+        """
+        with self.condition:
+            transition = self.ready.get(triad)
+            self.generation += 1
+            self.ready = {}
+            self.job = None
+        if transition is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return transition
+
+    def hitRate(self):
+        """
+        Returns: The fraction of claims that found a ready Transition (0.0 before any claim)
+        """
+        claims = self.hits + self.misses
+        return self.hits / claims if claims else 0.0
+
+    def workerLoop(self):
+        """
+        Waits for a job, then computes a Transition for each Triad until the board changes.
+        Returns once stop is called.
+        """
+        while True:
+            with self.condition:
+                while self.job is None and not self.stopping:
+                    self.condition.wait()
+                if self.stopping:
+                    return
+                generation, snapshot = self.job
+                self.job = None
+            cardsInPlay, idListInPlay, solutionIds, newDeck = snapshot
+            for triad in boardTriads(idListInPlay, solutionIds):
+                transition = self.game.claimTransition(triad, cardsInPlay, idListInPlay, solutionIds, newDeck)
+                with self.condition:
+                    if generation != self.generation:
+                        break
+                    self.ready[triad] = transition
+
+
+def boardSummary(cardsInPlay, idListInPlay, solutionIds, newDeck):
+    """
+    Returns: A comparable tuple of a board, with Cards reduced to their IDs
+    """
+    return ([card.id for card in cardsInPlay], list(idListInPlay), dict(solutionIds),
+            [card.id for card in newDeck])
+
+
+def verifyTransitions(games=200, seed=0):
+    """
+    Plays seeded games, claiming a random Triad each turn, and checks every claim against its speculated
+    Transition. Odd turns wait for the worker (so the claim commits the speculated Transition); even
+    turns discard it first (so the claim is computed inline). Either way, the committed board must equal
+    the Transition computed from a snapshot taken before the claim, apart from the order of a
+    guaranteed draw, which is shuffled on commit.
+
+    Args:
+        games: The number of games to play
+        seed: The seed for the deck shuffles and the Triads chosen
+
+    Returns: A Dictionary of counts (claims, hits, misses, guaranteed, mismatches)
+    """
+    from pygame import init
+    from .game import Game
+    from .gStateHandler import GameState
+
+    init()
+    random.seed(seed)
+    chooser = random.Random(seed)
+    game = Game()
+    counts = {"claims": 0, "hits": 0, "misses": 0, "guaranteed": 0, "mismatches": 0}
+
+    for _ in range(games):
+        game.resetGame()
+        GameState.state = 1
+        while GameState.state == 1:
+            snapshot = (list(game.cardsInPlay), list(game.idListInPlay), dict(game.solutionIds),
+                        list(game.newDeck))
+            before = boardSummary(*snapshot)
+            triad = chooser.choice(boardTriads(game.idListInPlay, game.solutionIds))
+            expected = game.claimTransition(triad, *snapshot)
+            if boardSummary(*snapshot) != before:
+                counts["mismatches"] += 1
+
+            if counts["claims"] % 2:
+                for _ in range(1000):
+                    with game.speculator.condition:
+                        if triad in game.speculator.ready:
+                            break
+                    sleep(0.001)
+            else:
+                game.speculator.invalidate()
+            hits = game.speculator.hits
+            game.selectedCards[:] = sorted(triad)
+            game.checkSet()
+            counts["claims"] += 1
+            counts["hits" if game.speculator.hits > hits else "misses"] += 1
+
+            actual = boardSummary(game.cardsInPlay, game.idListInPlay, game.solutionIds, game.newDeck)
+            wanted = boardSummary(expected.cardsInPlay, expected.idListInPlay, expected.solutionIds,
+                                  expected.newDeck)
+            if expected.guaranteed:
+                counts["guaranteed"] += 1
+                count = len(expected.drawn)
+                actual = (sorted(actual[0][-count:]) + actual[0][:-count],
+                          sorted(actual[1][-count:]) + actual[1][:-count]) + actual[2:]
+                wanted = (sorted(wanted[0][-count:]) + wanted[0][:-count],
+                          sorted(wanted[1][-count:]) + wanted[1][:-count]) + wanted[2:]
+            if actual != wanted or expected.gameOver != (GameState.state == 2):
+                counts["mismatches"] += 1
+
+    game.speculator.stop()
+    return counts
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check speculated Transitions against the inline claim path.")
+    parser.add_argument("--games", type=int, default=200, help="number of seeded games to play")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the decks and the Triads chosen")
+    args = parser.parse_args(argv)
+    counts = verifyTransitions(args.games, args.seed)
+    print(", ".join("%s: %d" % item for item in counts.items()))
+    return 1 if counts["mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
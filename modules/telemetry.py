@@ -0,0 +1,227 @@
+"""This Module records gameplay Events and writes them to disk in the background.
+
+Events are things the Player does (selecting a Card, claiming or missing a Triad, shuffling)
+and things the Game does for them (a guaranteed draw). Each Event is a small tuple that is
+appended to a ring buffer on the input path. A background writer drains the buffer and writes
+the Events as JSON Lines to a set of rotating files, so no file or stdout writes ever happen
+while the Player is clicking.
+
+Telemetry is disabled by default. Call sites check `events.enabled` before building an Event,
+so a disabled recorder costs a single attribute lookup. Setting the LNS_TELEMETRY environment
+variable to a directory turns it on when the application launches.
+
+Usage:
+    python -m modules.telemetry
+
+measures the cost of an Event on the input path, disabled and enabled, and how fast the writer
+drains the buffer.
+
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+from collections import deque
+from timeit import timeit
+from time import perf_counter, time
+
+
+class Telemetry:
+    """
+    The Telemetry recorder buffers Events in memory and flushes them from a writer thread.
+
+    The ring buffer is a deque with a maximum length. Appending to it is atomic, so the input path
+    never takes a lock. When the buffer is full, the oldest Events are overwritten and counted as dropped.
+
+        Attributes:
+            enabled: A boolean that call sites check before recording an Event
+            capacity: The integer number of Events the ring buffer holds
+            directory: The directory the rotating files are written to
+            maxBytes: The integer size at which the current file is rotated
+            backups: The integer number of rotated files that are kept
+            interval: The number of seconds the writer waits between flushes
+            written: The integer count of Events written to disk
+    """
+
+    def __init__(self, capacity=65536, maxBytes=8 * 1024 * 1024, backups=5, interval=0.5):
+        """
+        Initiates a disabled Telemetry recorder
+
+        Args:
+            capacity: The integer number of Events the ring buffer holds
+            maxBytes: The integer size at which the current file is rotated
+            backups: The integer number of rotated files that are kept
+            interval: The number of seconds the writer waits between flushes
+        """
+        self.enabled = False
+        self.capacity = capacity
+        self.directory = None
+        self.maxBytes = maxBytes
+        self.backups = backups
+        self.interval = interval
+        self.written = 0
+        self.buffer = deque(maxlen=capacity)
+        self.recorded = 0
+        self.wallStart = 0.0
+        self.clockStart = 0.0
+        self.file = None
+        self.stopEvent = threading.Event()
+        self.writer = None
+
+    def record(self, kind, *data):
+        """
+        Pushes an Event into the ring buffer. Meant to be called only when enabled is True.
+
+        Args:
+            kind: A short String naming the Event (e.g. "select", "claim")
+            data: Any JSON-serializable values describing the Event
+        """
+        self.buffer.append((perf_counter(), kind, data))
+        self.recorded += 1
+
+    def start(self, directory):
+        """
+        Opens the first file and starts the background writer
+
+        Args:
+            directory: Where the rotating files are written
+        """
+        if self.enabled:
+            return
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.wallStart = time()
+        self.clockStart = perf_counter()
+        self.file = open(self.filePath(0), "a", encoding="utf-8")
+        self.stopEvent.clear()
+        self.writer = threading.Thread(target=self.writerLoop, name="telemetry-writer", daemon=True)
+        self.writer.start()
+        self.enabled = True
+
+    def stop(self):
+        """
+        Stops recording, writes any buffered Events and closes the current file
+        """
+        if not self.enabled:
+            return
+        self.enabled = False
+        self.stopEvent.set()
+        self.writer.join()
+        self.writer = None
+        self.flush()
+        self.file.close()
+        self.file = None
+
+    def dropped(self):
+        """
+        Returns: The integer count of Events overwritten before they could be written
+        """
+        return self.recorded - self.written - len(self.buffer)
+
+    def filePath(self, index):
+        """
+        Args:
+            index: 0 for the current file, 1 and up for older rotated files
+
+        Returns: The path of the file
+        """
+        name = "telemetry.jsonl" if index == 0 else "telemetry.jsonl.%d" % index
+        return os.path.join(self.directory, name)
+
+    def writerLoop(self):
+        """
+        Flushes the ring buffer every interval until stop is called
+        """
+        while not self.stopEvent.wait(self.interval):
+            self.flush()
+
+    def flush(self):
+        """
+        Drains the ring buffer into the current file. Sizes are checked line by line, so the file is
+        rotated before a line would take it past maxBytes (only a single line longer than maxBytes
+        can exceed it). Timestamps are converted from the monotonic clock to wall-clock seconds here,
+        off the input path.
+        """
+        lines = []
+        buffer = self.buffer
+        offset = self.wallStart - self.clockStart
+        while buffer:
+            try:
+                stamp, kind, data = buffer.popleft()
+            except IndexError:
+                break
+            lines.append(json.dumps({"t": round(stamp + offset, 6), "event": kind, "data": data}))
+        if not lines:
+            return
+        size = self.file.tell()
+        chunk = []
+        for line in lines:
+            # json.dumps escapes non-ASCII, so the length of a line is its size in bytes
+            length = len(line) + 1
+            if size + length > self.maxBytes and size > 0:
+                self.writeLines(chunk)
+                self.rotate()
+                size = 0
+                chunk = []
+            chunk.append(line)
+            size += length
+        self.writeLines(chunk)
+        self.written += len(lines)
+
+    def writeLines(self, lines):
+        """
+        Writes Events, already serialized, to the current file
+
+        Args:
+            lines: A List of JSON Strings
+        """
+        if lines:
+            self.file.write("\n".join(lines) + "\n")
+            self.file.flush()
+
+    def rotate(self):
+        """
+        Closes the current file and shifts the older files up by one, deleting the oldest.
+        With no backups, the current file is simply truncated.
+        """
+        self.file.close()
+        for index in range(self.backups, 0, -1):
+            source = self.filePath(index - 1)
+            if os.path.exists(source):
+                os.replace(source, self.filePath(index))
+        self.file = open(self.filePath(0), "w", encoding="utf-8")
+
+
+events = Telemetry()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the cost of recording telemetry Events.")
+    parser.add_argument("--events", type=int, default=1000000, help="number of Events to time")
+    args = parser.parse_args(argv)
+    count = args.events
+
+    recorder = Telemetry(capacity=count)
+    scope = {"recorder": recorder}
+    # Call sites are written as "if events.enabled: events.record(...)", so that is what is timed
+    baseline = timeit("pass", number=count)
+    disabled = timeit("if recorder.enabled: recorder.record('select', 1111)", globals=scope, number=count)
+    print("disabled  %6.1f ns/event (%.1f ns over an empty statement)" % (
+        disabled / count * 1e9, (disabled - baseline) / count * 1e9))
+
+    with tempfile.TemporaryDirectory() as directory:
+        recorder.start(directory)
+        enabled = timeit("if recorder.enabled: recorder.record('select', 1111)", globals=scope, number=count)
+        print("enabled   %6.1f ns/event" % (enabled / count * 1e9))
+        start = perf_counter()
+        recorder.stop()
+        drained = perf_counter() - start
+        print("writer    %6.2f us/event (%d written, %d dropped)" % (
+            drained / max(recorder.written, 1) * 1e6, recorder.written, recorder.dropped()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())